@@ -1,134 +1,211 @@
-import matplotlib.pyplot as plt
-import numpy as np
-import pandas as pd
-import os
-import scipy
-from sklearn.linear_model import LinearRegression
-from sklearn.metrics import r2_score
-import scipy.stats as stats
-
-print("=== FORCE-DISPLACEMENT POST-PROCESSING SCRIPT ===")
-
-# ====== CONFIGURATION ======
-excel_file = "S_0-3/picc_s03_r00.xlsx"  # Name of your Excel file
-sheet_name = "Sheet1"        # Sheet name (or 0 for first sheet)
-
-# Column names in Excel file
-force_column = "force"       # Force column (N)
-displacement_column = "displacement"  # Displacement column (mm)
-
-# ====== EXCEL FILE READING ======
-try:
-    # Check if file exists
-    if not os.path.exists(excel_file):
-        print("File not found:", excel_file)
-        print("Available files in directory:")
-        for file in os.listdir("."):
-            if file.endswith(('.xlsx', '.xls', '.csv')):
-                print("  -", file)
-        exit()
-    
-    # Read Excel file
-    print("Reading file:", excel_file)
-    df = pd.read_excel(excel_file, sheet_name=sheet_name)
-    
-    print("File read successfully")
-    print("Dimensions:", df.shape)
-    print("Available columns:", list(df.columns))
-    
-except Exception as e:
-    print(" Excel reading error:", str(e))
-    exit()
-
-# ====== DATA EXTRACTION ======
-forces = df[force_column].values
-displacements = df[displacement_column].values
-
-# MULTIPLY DISPLACEMENTS BY 2
-displacements = displacements * 2.0 # for the total displacement
-
-# ====== DATA CLEANING ======
-# Remove NaN values
-mask = ~(np.isnan(forces) | np.isnan(displacements))
-forces_clean = forces[mask]
-displacements_clean = displacements[mask]
-
-if len(forces_clean) < len(forces):
-    print(f"  {len(forces) - len(forces_clean)} NaN values removed")
-
-# ====== CYCLE ANALYSIS ======
-# Detect cycles (force peaks)
-from scipy.signal import find_peaks
-
-peaks, _ = find_peaks(forces_clean, height=np.max(forces_clean)*0.8)
-cycles_detected = len(peaks)
-print(f" Cycles detected: {cycles_detected}")
-
-# ====== MAIN PLOT ======
-plt.figure(figsize=(12, 8))
-plt.style.use('seaborn-v0_8' if 'seaborn-v0_8' in plt.style.available else 'default')
-
-# Plot force-displacement curve
-plt.plot(displacements_clean, forces_clean, 'b-', linewidth=1.5, label='Force vs Displacement')
-
-# Mark peaks (cycles)
-if len(peaks) > 0:
-    plt.plot(displacements_clean[peaks], forces_clean[peaks], 'ro', 
-             markersize=6, label=f'Cycle peaks ({len(peaks)})')
-
-# ====== FORMATTING ======
-plt.xlabel('Displacement (mm)', fontsize=12, fontweight='bold')
-plt.ylabel('Load (N)', fontsize=12, fontweight='bold')
-plt.title('Force-Displacement Curve\nCyclic Fatigue Analysis', fontsize=14, fontweight='bold')
-plt.grid(True, alpha=0.3)
-plt.legend(fontsize=10)
-
-# Statistics on the plot
-stats_text = f"""Statistics:
-• Points: {len(forces_clean)}
-• Cycles: {cycles_detected}
-• Max force: {np.max(forces_clean):.0f} N
-• Max disp.: {np.max(displacements_clean):.3f} mm
-• Amplitude: {np.max(forces_clean) - np.min(forces_clean):.0f} N"""
-
-plt.text(0.02, 0.98, stats_text, transform=plt.gca().transAxes, 
-         verticalalignment='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.8),
-         fontsize=9)
-
-# ====== SECONDARY PLOT - ZOOM ONE CYCLE ======
-
-cycle = 21
-force_min = 0
-
-if cycle == 1:
-    start = 0  # first cycle starts at the beginning
-else:
-    start = peaks[cycle - 2]  # end of the previous cycle (previous peak)
-    
-    for i in range(start, peaks[cycle - 1]):
-        if forces_clean[i] <= force_min:  # tolerance to consider "force ≈ 0"
-            start = i
-            break
-
-end = peaks[cycle - 1]  #   peak of the current cycle
-
-# search for return to 0 after the peak
-for i in range(end, len(forces_clean)):
-    if forces_clean[i] <= force_min:  
-        end = i
-        break
-
-
-forces_cycle = forces_clean[start:end]
-disps_cycle = displacements_clean[start:end]
-
-plt.figure(figsize=(10, 6))
-plt.style.use('default')
-plt.plot(disps_cycle, forces_cycle, 'g-', linewidth=2, label='Last cycle ' + f' {cycle}')
-plt.xlabel('Displacement (mm)', fontsize=12, fontweight='bold')
-plt.ylabel('Force (N)', fontsize=12, fontweight='bold')
-plt.title('Last cycle '+f'{cycle}', fontsize=14, fontweight='bold')
-plt.grid(True, alpha=0.3)
-plt.legend()
-
-plt.show()
\ No newline at end of file
+import sys
+
+import matplotlib
+
+# Batch runs (--save) render through Agg and never pull in a GUI toolkit;
+# the backend has to be picked before pyplot is imported
+SAVE_PLOTS = "--save" in sys.argv
+if SAVE_PLOTS:
+    matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import os
+import scipy
+from sklearn.linear_model import LinearRegression
+from sklearn.metrics import r2_score
+import scipy.stats as stats
+
+print("=== FORCE-DISPLACEMENT POST-PROCESSING SCRIPT ===")
+
+# Style resolved once at startup instead of per figure, and interactive
+# mode switched off so nothing triggers a canvas draw while the figures
+# are still being assembled
+plt.style.use('seaborn-v0_8' if 'seaborn-v0_8' in plt.style.available else 'default')
+plt.ioff()
+
+# ====== CONFIGURATION ======
+excel_file = "S_0-3/picc_s03_r00.xlsx"  # Name of your Excel file
+sheet_name = "Sheet1"        # Sheet name (or 0 for first sheet)
+
+# Column names in Excel file
+force_column = "force"       # Force column (N)
+displacement_column = "displacement"  # Displacement column (mm)
+
+# ====== EXCEL FILE READING ======
+try:
+    # Check if file exists
+    if not os.path.exists(excel_file):
+        print("File not found:", excel_file)
+        print("Available files in directory:")
+        with os.scandir(".") as entries:
+            for entry in entries:
+                if entry.name.endswith(('.xlsx', '.xls', '.csv')):
+                    print("  -", entry.name)
+        exit()
+    
+    # Sidecar cache : the xlsx never changes between plotting sessions, so
+    # the parsed frame is kept next to it and reused as long as it is newer
+    # than the workbook. Feather when pyarrow is available, CSV otherwise
+    cache_file = excel_file + ".feather"
+    csv_cache = excel_file + ".cache.csv"
+    xlsx_mtime = os.path.getmtime(excel_file)
+    df = None
+    if os.path.exists(cache_file) and os.path.getmtime(cache_file) >= xlsx_mtime:
+        print("Reading cache:", cache_file)
+        df = pd.read_feather(cache_file)
+    elif os.path.exists(csv_cache) and os.path.getmtime(csv_cache) >= xlsx_mtime:
+        print("Reading cache:", csv_cache)
+        df = pd.read_csv(csv_cache)
+
+    if df is None:
+        # Read Excel file : read-only workbook without styles or formulas, and
+        # only the two columns the script uses
+        print("Reading file:", excel_file)
+        df = pd.read_excel(excel_file, sheet_name=sheet_name,
+                           usecols=lambda c: c in (force_column, displacement_column),
+                           engine="openpyxl",
+                           engine_kwargs={"read_only": True, "data_only": True})
+        try:
+            df.to_feather(cache_file)
+        except ImportError:
+            df.to_csv(csv_cache, index=False)
+    
+    print("File read successfully")
+    print("Dimensions:", df.shape)
+    print("Available columns:", list(df.columns))
+    
+except Exception as e:
+    print(" Excel reading error:", str(e))
+    exit()
+
+# ====== DATA CLEANING ======
+# Remove NaN values : one dropna over the two-column block replaces the
+# pair of isnan passes and the boolean gather
+clean = df[[force_column, displacement_column]].dropna()
+if len(clean) < len(df):
+    print(f"  {len(df) - len(clean)} NaN values removed")
+
+# ====== DATA EXTRACTION ======
+# Single precision is plenty for plotting load-cell data and halves the
+# bytes pushed through the rendering transforms
+forces_clean = clean[force_column].to_numpy(dtype=np.float32)
+displacements_clean = clean[displacement_column].to_numpy(dtype=np.float32)
+
+# MULTIPLY DISPLACEMENTS BY 2
+# In place : the extracted buffer is ours, so no copy is needed
+displacements_clean *= 2.0 # for the total displacement
+
+# ====== CYCLE ANALYSIS ======
+# Detect cycles (force peaks)
+from scipy.signal import find_peaks
+
+# Extrema computed once and reused by the peak threshold and the stats box
+fmin, fmax = forces_clean.min(), forces_clean.max()
+dmax = displacements_clean.max()
+
+# Peak indices cached next to the workbook, keyed on its mtime : when
+# iterating on the zoomed cycle the script reruns end-to-end and can skip
+# the scan entirely
+peaks_cache = f"{excel_file}.peaks.{int(os.path.getmtime(excel_file))}.npy"
+if os.path.exists(peaks_cache):
+    peaks = np.load(peaks_cache)
+else:
+    peaks, _ = find_peaks(forces_clean, height=fmax*0.8)
+    np.save(peaks_cache, peaks)
+cycles_detected = len(peaks)
+print(f" Cycles detected: {cycles_detected}")
+
+# ====== MAIN PLOT ======
+plt.figure(figsize=(12, 8))
+
+# Plot force-displacement curve. Dense histories are rasterized per artist
+# so vector exports keep vector axes and labels but embed the curve as an
+# image instead of a path with one segment per sample
+line, = plt.plot(displacements_clean, forces_clean, 'b-', linewidth=1.5, label='Force vs Displacement')
+if len(forces_clean) > 5000:
+    line.set_rasterized(True)
+
+# Mark peaks (cycles)
+if len(peaks) > 0:
+    plt.plot(displacements_clean[peaks], forces_clean[peaks], 'ro', 
+             markersize=6, label=f'Cycle peaks ({len(peaks)})')
+
+# ====== FORMATTING ======
+plt.xlabel('Displacement (mm)', fontsize=12, fontweight='bold')
+plt.ylabel('Load (N)', fontsize=12, fontweight='bold')
+plt.title('Force-Displacement Curve\nCyclic Fatigue Analysis', fontsize=14, fontweight='bold')
+plt.grid(True, alpha=0.3)
+plt.legend(fontsize=10)
+
+# Statistics on the plot
+stats_text = f"""Statistics:
+• Points: {len(forces_clean)}
+• Cycles: {cycles_detected}
+• Max force: {fmax:.0f} N
+• Max disp.: {dmax:.3f} mm
+• Amplitude: {fmax - fmin:.0f} N"""
+
+plt.text(0.02, 0.98, stats_text, transform=plt.gca().transAxes, 
+         verticalalignment='top', bbox=dict(boxstyle='round', facecolor='white', alpha=0.8),
+         fontsize=9)
+
+# ====== SECONDARY PLOT - ZOOM ONE CYCLE ======
+
+cycle = 21
+force_min = 0
+
+
+def cycle_window(k):
+    """Index window [start, end] bracketing cycle k between returns to zero.
+
+    The bounds fall back on the neighbouring peaks when the force never
+    comes back down to force_min on either side.
+    """
+    if k == 1:
+        start = 0  # first cycle starts at the beginning
+    else:
+        start = int(peaks[k - 2])  # end of the previous cycle (previous peak)
+
+        # first sample at "force ≈ 0" before the current peak
+        hits = np.flatnonzero(forces_clean[start:peaks[k - 1]] <= force_min)
+        if hits.size:
+            start += int(hits[0])
+
+    end = int(peaks[k - 1])  # peak of the current cycle
+
+    # search for return to 0 after the peak
+    hits = np.flatnonzero(forces_clean[end:] <= force_min)
+    if hits.size:
+        end += int(hits[0])
+
+    return start, end
+
+
+start, end = cycle_window(cycle)
+
+
+forces_cycle = forces_clean[start:end]
+disps_cycle = displacements_clean[start:end]
+
+plt.figure(figsize=(10, 6))
+plt.style.use('default')
+line, = plt.plot(disps_cycle, forces_cycle, 'g-', linewidth=2, label='Last cycle ' + f' {cycle}')
+if len(forces_cycle) > 5000:
+    line.set_rasterized(True)
+plt.xlabel('Displacement (mm)', fontsize=12, fontweight='bold')
+plt.ylabel('Force (N)', fontsize=12, fontweight='bold')
+plt.title('Last cycle '+f'{cycle}', fontsize=14, fontweight='bold')
+plt.grid(True, alpha=0.3)
+plt.legend()
+
+if SAVE_PLOTS:
+    plt.figure(1)
+    plt.savefig("force_displacement.png", dpi=150)
+    plt.figure(2)
+    plt.savefig(f"cycle_{cycle}.png", dpi=150)
+    plt.close('all')
+else:
+    plt.gcf().canvas.draw_idle()
+    plt.show()
\ No newline at end of file
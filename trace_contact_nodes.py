@@ -1,95 +1,169 @@
-import pandas as pd
-import matplotlib.pyplot as plt
-import numpy as np
-import os
-
-# ====== CONFIGURATION ======
-excel_file = "S_0-1/contact_s01_r00.xlsx"  # Nom de votre fichier Excel
-sheet_name = "Sheet1"              # Nom de la feuille (ou 0 pour la première)
-
-# Colonnes à lire
-time_column = "time"
-node_columns = ["node47", "node46", "node45"]
-
-# ====== LECTURE DU FICHIER EXCEL ======
-try:
-    # Vérifier si le fichier existe
-    if not os.path.exists(excel_file):
-        print("Fichier non trouvé:", excel_file)
-        print("Fichiers disponibles dans le répertoire:")
-        for file in os.listdir("."):
-            if file.endswith(('.xlsx', '.xls', '.csv')):
-                print("  -", file)
-        exit()
-    
-    # Lire le fichier Excel
-    print("Lecture du fichier:", excel_file)
-    df = pd.read_excel(excel_file, sheet_name=sheet_name)
-    
-    print("Fichier lu avec succès")
-    print("Dimensions:", df.shape)
-    print("Colonnes disponibles:", list(df.columns))
-    
-except Exception as e:
-    print("Erreur lors de la lecture du fichier Excel:", str(e))
-    exit()
-
-# ====== VÉRIFICATION DES COLONNES ======
-required_columns = [time_column] + node_columns
-missing_columns = [col for col in required_columns if col not in df.columns]
-
-if missing_columns:
-    print(f"Colonnes manquantes: {missing_columns}")
-    print("Colonnes disponibles:", list(df.columns))
-    exit()
-
-# ====== EXTRACTION DES DONNÉES ======
-time_data = df[time_column].values
-
-# Nettoyer les données (supprimer les valeurs NaN)
-mask = ~np.isnan(time_data)
-time_clean = time_data[mask]
-
-node_data = {}
-for node in node_columns:
-    data = df[node].values[mask]
-    # Supprimer les NaN pour chaque nœud
-    node_mask = ~np.isnan(data)
-    if len(data[node_mask]) > 0:
-        node_data[node] = data
-    else:
-        print(f"Attention: Pas de données valides pour {node}")
-
-print(f"Données nettoyées - {len(time_clean)} points temporels")
-
-# ====== CRÉATION DU GRAPHIQUE ======
-plt.figure(figsize=(12, 8))
-
-# Couleurs pour chaque nœud
-colors = ['red', 'blue', 'green', 'orange', 'purple']
-
-# Tracer chaque nœud
-for i, (node, data) in enumerate(node_data.items()):
-    color = colors[i % len(colors)]
-    plt.plot(time_clean, data, color=color, linewidth=2, label=node, marker='o', markersize=3)
-
-# Configuration du graphique
-plt.xlabel('Time', fontsize=12, fontweight='bold')
-plt.ylabel('Node Values', fontsize=12, fontweight='bold')
-plt.title('Evolution of Node Values Over Time', fontsize=14, fontweight='bold')
-plt.grid(True, alpha=0.3)
-plt.legend()
-
-# Améliorer l'affichage
-plt.tight_layout()
-
-# Afficher les statistiques
-print("\n====== STATISTIQUES ======")
-for node, data in node_data.items():
-    print(f"{node}:")
-    print(f"  Min: {np.min(data):.3f}")
-    print(f"  Max: {np.max(data):.3f}")
-    print(f"  Moyenne: {np.mean(data):.3f}")
-    print(f"  Écart-type: {np.std(data):.3f}")
-
-plt.show()
\ No newline at end of file
+import sys
+
+import pandas as pd
+import matplotlib
+
+# Les exécutions en lot (--save) passent par Agg sans charger de toolkit
+# graphique ; le backend doit être choisi avant l'import de pyplot
+SAVE_PLOTS = "--save" in sys.argv
+if SAVE_PLOTS:
+    matplotlib.use("Agg")
+
+import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+from matplotlib.lines import Line2D
+import numpy as np
+import os
+
+# ====== CONFIGURATION ======
+excel_file = "S_0-1/contact_s01_r00.xlsx"  # Nom de votre fichier Excel
+sheet_name = "Sheet1"              # Nom de la feuille (ou 0 pour la première)
+
+# Colonnes à lire
+time_column = "time"
+node_columns = ["node47", "node46", "node45"]
+
+# ====== LECTURE DU FICHIER EXCEL ======
+try:
+    # Vérifier si le fichier existe
+    if not os.path.exists(excel_file):
+        print("Fichier non trouvé:", excel_file)
+        print("Fichiers disponibles dans le répertoire:")
+        with os.scandir(".") as entries:
+            for entry in entries:
+                if entry.name.endswith(('.xlsx', '.xls', '.csv')):
+                    print("  -", entry.name)
+        exit()
+    
+    # Cache en sidecar : le xlsx ne change pas entre deux tracés, donc le
+    # DataFrame est conservé à côté et réutilisé tant qu'il est plus récent
+    # que le classeur. Feather si pyarrow est disponible, CSV sinon
+    cache_file = excel_file + ".feather"
+    csv_cache = excel_file + ".cache.csv"
+    xlsx_mtime = os.path.getmtime(excel_file)
+    df = None
+    if os.path.exists(cache_file) and os.path.getmtime(cache_file) >= xlsx_mtime:
+        print("Lecture du cache:", cache_file)
+        df = pd.read_feather(cache_file)
+    elif os.path.exists(csv_cache) and os.path.getmtime(csv_cache) >= xlsx_mtime:
+        print("Lecture du cache:", csv_cache)
+        df = pd.read_csv(csv_cache)
+
+    if df is None:
+        # Lire le classeur directement par l'itérateur openpyxl en lecture
+        # seule : les cellules des colonnes utiles sont accumulées puis
+        # converties en une fois, sans payer l'inférence de types de pandas.
+        # Les colonnes manquantes restent détectées par la vérification plus bas
+        print("Lecture du fichier:", excel_file)
+        from openpyxl import load_workbook
+        wb = load_workbook(excel_file, read_only=True, data_only=True)
+        ws = wb[sheet_name]
+        rows = ws.iter_rows(values_only=True)
+        header = next(rows)
+        wanted = [time_column] + node_columns
+        indices = [i for i, name in enumerate(header) if name in wanted]
+        records = [[row[i] for i in indices] for row in rows]
+        wb.close()
+        df = pd.DataFrame(records, columns=[header[i] for i in indices])
+        try:
+            df.to_feather(cache_file)
+        except ImportError:
+            df.to_csv(csv_cache, index=False)
+    
+    print("Fichier lu avec succès")
+    print("Dimensions:", df.shape)
+    print("Colonnes disponibles:", list(df.columns))
+    
+except Exception as e:
+    print("Erreur lors de la lecture du fichier Excel:", str(e))
+    exit()
+
+# ====== VÉRIFICATION DES COLONNES ======
+required_columns = [time_column] + node_columns
+missing_columns = [col for col in required_columns if col not in df.columns]
+
+if missing_columns:
+    print(f"Colonnes manquantes: {missing_columns}")
+    print("Colonnes disponibles:", list(df.columns))
+    exit()
+
+# ====== EXTRACTION DES DONNÉES ======
+# Nettoyer les données en un seul passage : un dropna sur le bloc 2-D
+# remplace le masquage colonne par colonne et garantit que time_clean et
+# chaque série de nœud ont la même longueur
+sub = df[[time_column] + node_columns].dropna()
+if len(sub) < len(df):
+    print(f"Attention: {len(df) - len(sub)} lignes incomplètes supprimées")
+
+# La simple précision suffit largement pour le tracé et divise par deux
+# les octets poussés dans les transformations de rendu
+time_clean = sub[time_column].to_numpy(dtype=np.float32)
+# Bloc contigu (n_nœuds, n_instants) : une ligne par nœud, dans l'ordre de
+# node_columns, pour que les statistiques se réduisent le long d'un axe
+node_values = sub[node_columns].to_numpy(dtype=np.float32).T
+
+print(f"Données nettoyées - {len(time_clean)} points temporels")
+
+# ====== CRÉATION DU GRAPHIQUE ======
+# Mode interactif coupé : aucun redessin du canevas tant que la figure
+# n'est pas complète
+plt.ioff()
+plt.figure(figsize=(12, 8))
+
+# Couleurs pour chaque nœud
+colors = ['red', 'blue', 'green', 'orange', 'purple']
+
+# Tracer tous les nœuds en une seule LineCollection : un seul artiste et un
+# seul appel au backend au lieu d'une Line2D par nœud
+node_colors = [colors[i % len(colors)] for i in range(len(node_columns))]
+segs = [np.column_stack([time_clean, row]) for row in node_values]
+lc = LineCollection(segs, colors=node_colors, linewidths=2)
+# Rastériser les courbes denses : les axes restent vectoriels à l'export
+if len(time_clean) > 5000:
+    lc.set_rasterized(True)
+ax = plt.gca()
+ax.add_collection(lc)
+
+# Les marqueurs de toutes les courbes en un seul scatter, échantillonnés
+# pour n'estamper qu'environ 50 points par courbe
+marker_step = max(1, len(time_clean) // 50)
+marker_times = time_clean[::marker_step]
+ax.scatter(np.tile(marker_times, len(node_columns)),
+           node_values[:, ::marker_step].ravel(),
+           c=np.repeat(node_colors, len(marker_times)), s=9)
+ax.autoscale_view()
+
+# Configuration du graphique
+plt.xlabel('Time', fontsize=12, fontweight='bold')
+plt.ylabel('Node Values', fontsize=12, fontweight='bold')
+plt.title('Evolution of Node Values Over Time', fontsize=14, fontweight='bold')
+plt.grid(True, alpha=0.3)
+
+# La LineCollection ne porte pas de label par courbe : la légende passe par
+# des artistes mandataires
+plt.legend(handles=[Line2D([], [], color=c, linewidth=2, label=node)
+                    for node, c in zip(node_columns, node_colors)])
+
+# Améliorer l'affichage
+plt.tight_layout()
+
+# Afficher les statistiques
+print("\n====== STATISTIQUES ======")
+# Les quatre réductions se font en une passe chacune sur le bloc 2-D
+mins = node_values.min(axis=1)
+maxs = node_values.max(axis=1)
+means = node_values.mean(axis=1)
+stds = node_values.std(axis=1)
+for node, vmin, vmax, vmean, vstd in zip(node_columns, mins, maxs, means, stds):
+    print(f"{node}:")
+    print(f"  Min: {vmin:.3f}")
+    print(f"  Max: {vmax:.3f}")
+    print(f"  Moyenne: {vmean:.3f}")
+    print(f"  Écart-type: {vstd:.3f}")
+
+if SAVE_PLOTS:
+    plt.savefig("contact_nodes.png", dpi=150)
+    plt.close()
+else:
+    plt.gcf().canvas.draw_idle()
+    plt.show()
\ No newline at end of file